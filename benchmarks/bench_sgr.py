@@ -0,0 +1,60 @@
+""" Bytes per cell of the swatch explorer's output
+
+    `naive` writes every cell as its own bar (as print_colored_line does):
+    a background sequence, a separate foreground one for the cursor, the
+    cell and ARST. `explorer` is what the explorer writes: cells of a run
+    share their sequence, fg and bg are merged into one, and there is a
+    single ARST per redraw. `move` is the redraw after one cursor move.
+
+    Run: python benchmarks/bench_sgr.py
+"""
+
+from time import perf_counter
+
+from termcolors.lib.explorer import CELL, Explorer, render_changes
+from termcolors.lib.m_utils.printing import ARST
+
+COLS, ROWS = 80, 24
+
+
+def naive() -> tuple[str, int]:
+    explorer = Explorer(COLS, ROWS + 1)
+    out = []
+    for row in range(explorer.rows):
+        out.append(f"\x1b[{row + 1};1H")
+        for col in range(explorer.cols):
+            out.append("\x1b[48;2;{};{};{}m".format(*explorer.rgb(row, col)))
+            text = CELL
+            if (row, col) == (explorer.row, explorer.col):
+                out.append("\x1b[38;2;255;255;255m")
+                text = "[]"
+            out.append(f"{text}{ARST}")
+    return "".join(out), explorer.cols * explorer.rows
+
+
+def explorer_frame() -> tuple[str, int]:
+    explorer = Explorer(COLS, ROWS + 1)
+    return (render_changes(None, explorer.frame()),
+            explorer.cols * explorer.rows)
+
+
+def move() -> tuple[str, int]:
+    explorer = Explorer(COLS, ROWS + 1)
+    previous = explorer.frame()
+    explorer.handle("right")
+    return render_changes(previous, explorer.frame()), 2
+
+
+def main() -> None:
+    print(f"{'output':<16}{'cells':>7}{'bytes':>8}{'B/cell':>9}{'ms':>8}")
+    for bench in (naive, explorer_frame, move):
+        start = perf_counter()
+        text, cells = bench()
+        took = (perf_counter() - start) * 1000
+        size = len(text.encode())
+        print(f"{bench.__name__:<16}{cells:>7}{size:>8}{size / cells:>9.1f}"
+              f"{took:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
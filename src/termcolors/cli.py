@@ -1,15 +1,27 @@
 import argparse
 from sys import argv
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from sys import exit as sysexit
-from typing import List, Dict
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict
 
 import pyperclip
+try:
+    import readline
+except ImportError:  # !INF: e.g. on Windows
+    readline = None
 
 from .lib.m_utils.printing import (AORG, ARED, ARST, num_to_bg_ansi,
                                    term_del_line)
+from .lib.colornames import complete_name
+from .lib.colorspec import (SPEC_PARSERS, is_comment, parse_color_spec,
+                            spec_format)
+from .lib.compression import open_colors_file
+from .lib.explorer import explore
+from .lib.pager import page_colors
+from .lib.stats import ColorStats, format_stats
 from .lib.palette import list_palettes
 from .lib.softdev.user_input import get_input
 from .lib.softdev.debug import RangeError, cprintd
@@ -21,6 +33,7 @@ FTITLE = __file__.split("/", maxsplit=-1)[-1].split(".", maxsplit=-1)[0]
 
 STATE = {'color': "", 'ansi_code': "", 'rgb': tuple(), 'hexa': "",
          'new': False, 'lines_to_del': 1, 'after_help': False,
+         'prompt': "",
          'palette': (False, ""),
          'del_lines_called': [],
          'end': True, 'log': [], 'cprintd': cprintd,
@@ -30,7 +43,7 @@ QUITCONT = {
         "continue": "__CONTINUE__",
         "shutdown": "__SHUTDOWN__"
         }
-HELP_LINES = 11  # 9
+HELP_LINES = 13  # 9
 COPYCOMMAND = ["fg", "bg"]
 if "-d" in argv or "--dev" in argv:
     cprintd = partial(STATE['cprintd'], dbg=True)
@@ -111,6 +124,7 @@ COMMANDS = {
         'prct':    lambda: change_method('prct'),
         'help':    lambda: usage(quit=False),
         'palette': lambda: palette(),
+        'explore': lambda: explore_colors(),
         'quit':    lambda: quit(),
         'q':       lambda: quit()
         }
@@ -123,6 +137,8 @@ NAMES = {'decm': {'method': "decimal",
                   'desc': "sets conversion from percentage format"},
          'help': {'method': "", 'desc': "prints this message"},
          'palette': {'method': "", 'desc': "generates a named palette"},
+         'explore': {'method': "",
+                     'desc': "picks a colour from a hue × lightness grid"},
          'quit': {'method': "", 'desc': "exits the application"}}
 
 
@@ -130,8 +146,10 @@ def ask_for_color() -> str:
 
     loc = f"{APPNAME}::{FTITLE}.ask_for_color"  # !DBG
     method = METHOD['current']
-    ans = get_input(f"Enter a colour code (R;G;B, {NAMES[method]['method']})"
-                    ", command or help")
+    prompt = (f"Enter a colour code (R;G;B, {NAMES[method]['method']})"
+              ", command or help")
+    STATE['prompt'] = f"{prompt} > "  # !INF: as get_input shows it
+    ans = get_input(prompt)
     color = ""
     try:
         if ans.lower() in COMMANDS:
@@ -139,7 +157,10 @@ def ask_for_color() -> str:
         if ans.lower() in COPYCOMMAND:
             return ans
 
-        r, g, b = map(CONVERSIONS[method], ans.split(";"))
+        if spec_format(ans) is not None:
+            r, g, b = parse_color_spec(ans)
+        else:
+            r, g, b = map(CONVERSIONS[method], ans.split(";"))
         color = f"#{r:02x}{g:02x}{b:02x}"
 
     except ValueError as e:
@@ -147,7 +168,9 @@ def ask_for_color() -> str:
             print(f"{AORG}No input given, quitting...{ARST}")
             return QUITCONT['quit']
 
-        cprint(f"{ARED}ERROR: unrecognized value/command {ans!r} - "
+        names = complete_name(ans, limit=5) if ans.isalpha() else []
+        hint = f" (did you mean: {', '.join(names)}?)" if names else ""
+        cprint(f"{ARED}ERROR: unrecognized value/command {ans!r}{hint} - "
                f"use 'help' for help{ARST}")
         return "__CONTINUE__"
     except RangeError as e:
@@ -167,31 +190,66 @@ def ask_for_color() -> str:
     return color
 
 
+@lru_cache(maxsize=8)
+def completions(text: str) -> tuple:
+    """ Commands and colour names starting with `text` """
+
+    commands = [command for command in (*COMMANDS, *COPYCOMMAND)
+                if command.startswith(text)]
+    return (*commands, *complete_name(text))
+
+
+def complete(text: str, state: int) -> str | None:
+    """ readline completer for the interactive mode """
+
+    options = completions(text)
+    return options[state] if state < len(options) else None
+
+
+def display_matches(substitution: str, matches: List[str],
+                    longest: int) -> None:
+    """ readline hook listing the completions below the prompt and drawing
+        the prompt again; the listed lines are added to the lines
+        `del_lines` clears """
+
+    lines = menu_lines(matches)
+    print()
+    print(*lines, sep="\n")
+    print(STATE['prompt'] + readline.get_line_buffer(), end="", flush=True)
+    STATE['lines_to_del'] += len(lines) + 1
+
+
+def menu_lines(names: List[str], width: int = 79,
+               sep: str = " | ") -> List[str]:
+    """ Wrap names (quoted) into menu lines shorter than `width` """
+
+    lines = []
+    line = []
+    length = 0  # !INF: length of the line, with a trailing separator
+    for name in sorted(names):
+        item = repr(name)
+        if line and length + len(item) + len(sep) >= width:
+            lines.append(sep.join(line))
+            line = []
+            length = 0
+        length += len(item) + len(sep)
+        line.append(item)
+    if line:
+        lines.append(sep.join(line))
+    return lines
+
+
 def palette() -> None:
     """ Generate a named (predefined) palette """
 
     loc = f"{APPNAME}::{FTITLE}.palette"  # !DBG
     palettes = list_palettes()
-    cnt = 0
-    lines = []
-    line = ""
-    for i, palette in enumerate(sorted(palettes)):
-        if len(line + f"{palette!r} | ") < 79:
-            line += f"{palette!r} | "
-            continue
-        else:
-            cnt += 1
-            line = line[:-3]
-            lines.append(line)
-            line = f"{palette!r} | "
-            continue
-    cnt += 1
-    line = line[:-3]
-    lines.append(line)
+    lines = menu_lines(palettes)
+    cnt = len(lines)
     print(*lines, sep="\n")
     palette_name = get_input("Enter a palette name", choices=palettes,
                              show_choices=False)
-    log(f"setting STATE['lines_to_del'] to {i + 2}", "palette")
+    log(f"setting STATE['lines_to_del'] to {cnt + 2}", "palette")
     STATE['lines_to_del'] = cnt + 2
     log(f"about to delete {STATE['lines_to_del']} lines", "palette")
     del_lines("palette")
@@ -200,6 +258,24 @@ def palette() -> None:
     STATE['palette'] = (True, palette_name)
 
 
+def explore_colors() -> None:
+    """ Pick a colour in the (keyboard-driven) swatch explorer """
+
+    del_lines("explore_colors")
+    try:
+        color = explore()
+    except OSError as e:
+        cprint(f"{ARED}error → {e}{ARST}")
+        return
+    if color is None:
+        return
+    ansi_code, rgb = num_to_bg_ansi(color, with_rgb_dec=True)
+    STATE['color'] = color
+    STATE['ansi_code'] = ansi_code
+    STATE['rgb'] = rgb
+    STATE['new'] = True
+
+
 def print_colored_line(nr_chars: int = 10,
                        ansi: str = "", hexa: str = "", ending: str = "") -> None:
     """ Print a line with specified color and ansi code """
@@ -269,32 +345,116 @@ def parse_color_value(value: str, fmt: str):
         raise ValueError(f"Unknown format: {fmt}")
 
 
-def read_colors_file(filename: str) -> List[Dict]:
+def parse_ssv_line(line: str) -> Dict:
+    """ Parse an `R;G;B;fmt` line into a colour dict """
+
+    parts = line.split(";")
+    if len(parts) < 4:
+        raise ValueError(f"invalid line: {line}")
+    r_s, g_s, b_s, fmt = parts[:4]
+    r = parse_color_value(r_s, fmt)
+    g = parse_color_value(g_s, fmt)
+    b = parse_color_value(b_s, fmt)
+    x = f"#{r:02x}{g:02x}{b:02x}"
+    return {"r": r, "g": g, "b": b, "x": x, "format": fmt}
+
+
+def parse_spec_line(line: str, fmt: str) -> Dict:
+    """ Parse a `#hex`, `rgb(…)`, `hsl(…)` or colour-name line """
+
+    r, g, b = SPEC_PARSERS[fmt](line)
+    x = f"#{r:02x}{g:02x}{b:02x}"
+    return {"r": r, "g": g, "b": b, "x": x, "format": fmt}
+
+
+LINE_PARSERS = {'ssv': parse_ssv_line,
+                **{fmt: partial(parse_spec_line, fmt=fmt)
+                   for fmt in SPEC_PARSERS}}
+SAMPLE_LINES = 64  # !INF: lines read to detect the format of a file
 
-    colors = []
+
+def line_format(line: str) -> str | None:
+    """ Which of the LINE_PARSERS syntaxes the line is in (None if any) """
+
+    if line.count(";") >= 3:
+        return "ssv"
+    return spec_format(line)
+
+
+def detect_format(lines: Iterable[str]) -> str | None:
+    """ The most common line format in a sample of (stripped) lines """
+
+    counts = {}
+    for line in lines:
+        if not line or is_comment(line):
+            continue
+        fmt = line_format(line)
+        if fmt is not None:
+            counts[fmt] = counts.get(fmt, 0) + 1
+    return max(counts, key=counts.get) if counts else None
+
+
+def sniff_colors_file(filepath: str | Path) -> str | None:
+    """ Detect the line format of a colour file from its first lines """
+
+    with open_colors_file(filepath) as fin:
+        return detect_format(line.strip()
+                             for line in islice(fin, SAMPLE_LINES))
+
+
+def parse_color_line(line: str, fmt: str | None = None) -> Dict | None:
+    """ Parse a single (stripped, non-comment) colour line into a dict
+
+        Args:
+            line (str): `R;G;B;fmt`, `#hex`, `rgb(…)`, `hsl(…)` or a name
+            fmt (str, optional): line format detected for the whole file;
+                lines not in it fall back to per-line detection.
+
+        Returns None if the values do not convert; raises ValueError if the
+        line is in none of the known formats.
+    """
+
+    if fmt is not None:
+        try:
+            return LINE_PARSERS[fmt](line)
+        except (ValueError, RangeError):
+            pass
+    fmt = line_format(line)
+    if fmt is None:
+        raise ValueError(f"invalid line: {line}")
+    try:
+        return LINE_PARSERS[fmt](line)
+    except (ValueError, RangeError):
+        return None
+
+
+def colors_file_path(filename: str | Path) -> Path:
     filepath = Path(filename)
-    filepath = ROOTPATH / filename if not filepath.exists() else filepath
-    cnt = 0  # !INF: for netto lines nr
-    with open(filepath, "r") as fin:
+    return ROOTPATH / filename if not filepath.exists() else filepath
+
+
+def iter_colors_file(filename: str | Path) -> Iterator[Dict]:
+    """ Stream the colours of a file, line by line """
+
+    filepath = colors_file_path(filename)
+    fmt = sniff_colors_file(filepath)
+    with open_colors_file(filepath) as fin:
         for line_no, line in enumerate(fin, start=1):
             line = line.strip()
-            if not line or line.startswith("#"):
+            if not line or is_comment(line):
                 continue
-            parts = line.split(";")
-            if len(parts) < 4:
-                print(f"Skipping invalid line {line_no}: {line}")
-                continue
-            r_s, g_s, b_s, fmt = parts[:4]
             try:
-                r = parse_color_value(r_s, fmt)
-                g = parse_color_value(g_s, fmt)
-                b = parse_color_value(b_s, fmt)
-                x = f"#{r:02x}{g:02x}{b:02x}"
-                cnt += 1
-            except (ValueError, RangeError):
+                color = parse_color_line(line, fmt)
+            except ValueError:
+                print(f"Skipping invalid line {line_no}: {line}")
                 continue
-            colors.append({"r": r, "g": g, "b": b, "x": x, "format": fmt})
-    return colors
+            if color is not None:
+                yield color
+
+
+def read_colors_file(filename: str) -> List[Dict]:
+
+    return list(iter_colors_file(filename))
 
 
 def batch_conversion(filename: str | Path | None = None,
@@ -302,8 +462,17 @@ def batch_conversion(filename: str | Path | None = None,
     """ Generating colors/ANSI codes from a .ssv file """
 
     loc = f"{APPNAME}::{FTITLE}.batch_conversion"  # !DBG
-    filename = filename if filename is not None else\
-            STATE['parser'].parse_args().file
+    if filename is None:
+        args = STATE['parser'].parse_args()
+        filename = args.file
+        pager = args.pager
+    else:  # !INF: e.g. a palette -- always printed whole
+        pager = False
+    if pager:
+        filepath = colors_file_path(filename)
+        page_colors(filepath, partial(parse_color_line,
+                                      fmt=sniff_colors_file(filepath)))
+        return QUITCONT["quit"] if once else QUITCONT["continue"]
     colors = read_colors_file(filename)
     colors_nr = len(colors)
     for i, color in enumerate(colors):
@@ -320,6 +489,16 @@ def batch_conversion(filename: str | Path | None = None,
     return QUITCONT["continue"]
 
 
+def color_stats(filenames: List[str], top: int = 10) -> None:
+    """ Statistics of the colours in one or more files """
+
+    stats = ColorStats()
+    for filename in filenames:
+        stats.update(color["r"] << 16 | color["g"] << 8 | color["b"]
+                     for color in iter_colors_file(filename))
+    print(*format_stats(stats, top=top), sep="\n")
+
+
 def copy_color(fbg: str) -> None:
     """ Copying the bg/fg colour to clipboard
 
@@ -351,6 +530,8 @@ def usage(quit: bool = False) -> None:
     print("Input color as 3 hex numbers, separated by semicolon, "
           "when prompted,")
     print("e.g. 'ff;00;00' for red.")
+    print("Colours can also be given as '#rrggbb', 'rgb(…)', 'hsl(…)' or by "
+          "name ([tab] completes).")
     print("Commands in the interactive mode:")
     print(f"    - {'/'.join(COPYCOMMAND)} to copy the current "
           "color to the clipboard \n      (ANSI foreground/background, "
@@ -385,15 +566,32 @@ def main() -> int | dict:
                         type=str,
                         help="file to process in batch mode"
                         )
+    parser.add_argument("-p", "--pager", action="store_true",
+                        help="browse the batch file page by page")
     parser.add_argument("-d", "--dev", action="store_true",
                         help="development mode")
     parser.add_argument("-v", "--version", action="store_true",
                         help="prints application version")
     parser.add_argument("-h", "--help", action="store_true",
                         help="prints help message")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    stats_parser = subparsers.add_parser(
+                        "stats",
+                        help="colour statistics of FILE(s)",
+                        description="Colour statistics: count, unique "
+                        "colours, most common colours and a hue × lightness "
+                        "histogram"
+                        )
+    stats_parser.add_argument("files", metavar="FILE", nargs="+",
+                              help="file with colours (as for -f)")
+    stats_parser.add_argument("-k", "--top", metavar="K", type=int,
+                              default=10,
+                              help="number of most common colours to show")
     STATE['parser'] = parser
 
     args = parser.parse_args()
+    if args.pager and not args.file:
+        parser.error("-p/--pager requires -f/--file")
 
     mode = f" -- batch mode: {args.file!r}" if args.file\
             else " -- interactive mode"
@@ -404,11 +602,18 @@ def main() -> int | dict:
     if args.version:
         print(f"{APPNAME} v. {VERSION}")
         sysexit(0)
+    if args.command == "stats":
+        color_stats(args.files, top=args.top)
+        return 0
     print(f"{APPNAME} v. {VERSION}{mode}")
     if args.file:
-        result = batch_conversion()
+        result = batch_conversion(once=args.pager)
         if result == QUITCONT['quit']:
             return 0
+    if readline is not None:  # !INF: only the interactive prompt completes
+        readline.set_completer(complete)
+        readline.set_completion_display_matches_hook(display_matches)
+        readline.parse_and_bind("tab: complete")
 
     i = 0
     while True:
@@ -0,0 +1,128 @@
+# ./src/termcolors/lib/colorspec.py
+
+"""
+Module for parsing colour specifications: `#rrggbb`, `rgb(…)`, `hsl(…)`
+and X11/CSS colour names
+"""
+
+import re
+from colorsys import hls_to_rgb
+
+from .colornames import COLOR_NAMES, name_to_rgb, normalize_name
+from .softdev.debug import RangeError
+
+FTITLE = __file__.split("/", maxsplit=-1)[-1].split(".", maxsplit=-1)[0]
+
+HEX_RE = re.compile(r"#([0-9a-f]{3}|[0-9a-f]{6})", re.IGNORECASE)
+FUNC_RE = re.compile(r"(rgb|hsl)a?\((.*)\)", re.IGNORECASE)
+ARGS_RE = re.compile(r"[\s,/]+")
+
+
+def _args(text: str, func: str) -> list[str]:
+    match = FUNC_RE.fullmatch(text.strip())
+    if match is None or match.group(1).lower() != func:
+        raise ValueError(f"not a {func}(…) colour: {text!r}")
+    args = [arg for arg in ARGS_RE.split(match.group(2).strip()) if arg]
+    if len(args) not in (3, 4):  # !INF: the 4th one (alpha) is ignored
+        raise ValueError(f"{func}(…) takes 3 values, got {text!r}")
+    return args[:3]
+
+
+def _checked(value: float, maximum: float, text: str) -> float:
+    if not 0 <= value <= maximum:
+        err = f"Value {text!r} is out of range <0-{maximum:g}>"
+        raise RangeError(err)
+    return value
+
+
+def _channel(text: str) -> int:
+    """ rgb(…) channel: 0-255 or a percentage """
+
+    if text.endswith("%"):
+        return round(_checked(float(text[:-1]), 100, text) * 255 / 100)
+    return round(_checked(float(text), 255, text))
+
+
+def _percent(text: str) -> float:
+    """ hsl(…) saturation/lightness: a percentage, '%' being optional """
+
+    return _checked(float(text.rstrip("%")), 100, text) / 100
+
+
+def parse_hex(text: str) -> tuple[int, int, int]:
+    """ '#rrggbb' or '#rgb' → (R, G, B) """
+
+    text = text.strip()
+    if HEX_RE.fullmatch(text) is None:
+        raise ValueError(f"not a #hex colour: {text!r}")
+    digits = text[1:]
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def parse_rgb(text: str) -> tuple[int, int, int]:
+    """ 'rgb(255, 0, 0)', 'rgb(100% 0% 0%)' → (R, G, B) """
+
+    return tuple(map(_channel, _args(text, "rgb")))
+
+
+def parse_hsl(text: str) -> tuple[int, int, int]:
+    """ 'hsl(120, 100%, 50%)' → (R, G, B) """
+
+    h, s, l = _args(text, "hsl")
+    hue = float(h.lower().removesuffix("deg")) / 360 % 1
+    rgb = hls_to_rgb(hue, _percent(l), _percent(s))
+    return tuple(round(channel * 255) for channel in rgb)
+
+
+def parse_name(text: str) -> tuple[int, int, int]:
+    """ 'rebeccapurple', 'Alice Blue' → (R, G, B) """
+
+    try:
+        return name_to_rgb(text)
+    except KeyError:
+        raise ValueError(f"unknown colour name: {text!r}") from None
+
+
+SPEC_PARSERS = {"hex": parse_hex,
+                "rgb": parse_rgb,
+                "hsl": parse_hsl,
+                "name": parse_name}
+
+
+def spec_format(text: str) -> str | None:
+    """ Which of the SPEC_PARSERS syntaxes `text` is in (None if any) """
+
+    text = text.strip()
+    lower = text.lower()
+    if HEX_RE.fullmatch(text):
+        return "hex"
+    if lower.startswith(("rgb(", "rgba(")):
+        return "rgb"
+    if lower.startswith(("hsl(", "hsla(")):
+        return "hsl"
+    if normalize_name(text) in COLOR_NAMES:
+        return "name"
+    return None
+
+
+def parse_color_spec(text: str) -> tuple[int, int, int]:
+    """ Any of the SPEC_PARSERS syntaxes → (R, G, B)
+
+        Raises:
+            ValueError: if the syntax is not recognized or the values do not
+                convert
+            RangeError: if a value is out of its range
+    """
+
+    fmt = spec_format(text)
+    if fmt is None:
+        raise ValueError(f"unrecognized colour: {text!r}")
+    return SPEC_PARSERS[fmt](text)
+
+
+def is_comment(line: str) -> bool:
+    """ '#' starts a comment, unless the whole line is a #hex colour """
+
+    return line.startswith("#") and HEX_RE.fullmatch(line) is None
@@ -0,0 +1,80 @@
+# ./src/termcolors/lib/compression.py
+
+"""
+Module for reading (transparently) compressed colour files
+"""
+
+import io
+from pathlib import Path
+from typing import IO
+
+try:
+    import bz2
+except ImportError:  # !INF: Python built without bz2
+    bz2 = None
+try:
+    import gzip
+except ImportError:  # !INF: Python built without zlib
+    gzip = None
+try:
+    import lzma
+except ImportError:  # !INF: Python built without lzma
+    lzma = None
+
+FTITLE = __file__.split("/", maxsplit=-1)[-1].split(".", maxsplit=-1)[0]
+
+BLOCK_SIZE = 1 << 20  # !INF: bytes read (and decompressed) at once
+MAGIC = {b"\x1f\x8b": "gz",
+         b"BZh": "bz2",
+         b"\xfd7zXZ\x00": "xz"}
+OPENERS = {'gz': gzip.GzipFile if gzip else None,
+           'bz2': bz2.BZ2File if bz2 else None,
+           'xz': lzma.LZMAFile if lzma else None}
+SUFFIXES = tuple(f".{kind}" for kind in OPENERS)
+
+
+def compression(filepath: str | Path) -> str | None:
+    """ Compression of a file ('gz', 'bz2', 'xz'), from its magic bytes """
+
+    with open(filepath, "rb") as fin:
+        head = fin.read(max(map(len, MAGIC)))
+    for magic, kind in MAGIC.items():
+        if head.startswith(magic):
+            return kind
+    return None
+
+
+def open_colors_file(filepath: str | Path, mode: str = "r") -> IO:
+    """ Open a (possibly compressed) file for reading
+
+        Compressed files are decompressed on the fly, BLOCK_SIZE bytes at a
+        time, so they are never read (or decompressed) whole.
+
+        Args:
+            filepath (str | Path): file to open
+            mode (str, optional): "r" (text, utf-8) or "rb". Defaults to "r".
+
+        Raises:
+            OSError: if the file is compressed with an unsupported method
+    """
+
+    kind = compression(filepath)
+    if kind is None:
+        if "b" in mode:
+            return open(filepath, "rb", buffering=BLOCK_SIZE)
+        return open(filepath, "r", encoding="utf-8", buffering=BLOCK_SIZE)
+    if OPENERS[kind] is None:
+        err = f"{kind!r} compression is not supported by this Python"
+        raise OSError(err)
+    stream = io.BufferedReader(OPENERS[kind](filepath, "rb"),
+                               buffer_size=BLOCK_SIZE)
+    if "b" in mode:
+        return stream
+    return io.TextIOWrapper(stream, encoding="utf-8")
+
+
+def strip_suffix(filepath: Path) -> Path:
+    """ 'nord.ssv.gz' → 'nord.ssv' """
+
+    return filepath.with_suffix("") if filepath.suffix in SUFFIXES else\
+        filepath
@@ -0,0 +1,237 @@
+# ./src/termcolors/lib/explorer.py
+
+"""
+Module for the keyboard-driven hue × lightness swatch explorer
+"""
+
+import os
+import sys
+from select import select
+from colorsys import hls_to_rgb
+from shutil import get_terminal_size
+
+try:
+    import termios
+    import tty
+except ImportError:  # !INF: e.g. on Windows
+    termios = tty = None
+
+from .m_utils.printing import ARST
+
+FTITLE = __file__.split("/", maxsplit=-1)[-1].split(".", maxsplit=-1)[0]
+
+CELL = "  "  # !INF: a cell is two columns wide (roughly square)
+CURSOR = "[]"
+ALTSCR_ON = "\033[?1049h\033[?25l"  # !INF: alternate screen, hide cursor
+ALTSCR_OFF = "\033[?25h\033[?1049l"
+KEYS = {b"\x1b[A": "up", b"\x1bOA": "up", b"k": "up",
+        b"\x1b[B": "down", b"\x1bOB": "down", b"j": "down",
+        b"\x1b[C": "right", b"\x1bOC": "right", b"l": "right",
+        b"\x1b[D": "left", b"\x1bOD": "left", b"h": "left",
+        b"+": "more", b"-": "less",
+        b"\r": "pick", b"\n": "pick",
+        b"q": "quit", b"\x1b": "quit", b"\x03": "quit"}
+MOVES = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+LONGEST_KEY = max(map(len, KEYS))
+SATURATION_STEP = 0.1
+ESC_TIMEOUT = 0.05  # !INF: s to wait for the rest of an escape sequence
+RESIZE_POLL = 0.25  # !INF: s between terminal size checks when idle
+EXPLORER_HELP = "←↑→↓/hjkl: move, +/-: saturation, enter: pick, q: quit"
+
+
+def cell_sgr(bg: tuple, fg: tuple | None = None) -> str:
+    """ SGR sequence of a cell: background and (optionally) foreground,
+        merged into one sequence """
+
+    if fg is None:
+        return "\x1b[48;2;{};{};{}m".format(*bg)
+    return "\x1b[48;2;{};{};{};38;2;{};{};{}m".format(*bg, *fg)
+
+
+def render_changes(previous: list[list] | None, frame: list[list]) -> str:
+    """ Escape sequences turning the `previous` frame into `frame`
+
+        A frame is a list of rows of cells, a cell being a (style, text)
+        tuple, style being an SGR sequence. Only the runs of changed cells
+        are drawn (one cursor move per run) and consecutive cells of the
+        same style share one SGR sequence.
+    """
+
+    out = []
+    for row_nr, row in enumerate(frame):
+        old = previous[row_nr] if previous is not None else None
+        col_nr = 0
+        while col_nr < len(row):
+            if old is not None and row[col_nr] == old[col_nr]:
+                col_nr += 1
+                continue
+            out.append(f"\x1b[{row_nr + 1};{col_nr * len(CELL) + 1}H")
+            style = None
+            while col_nr < len(row) and (old is None or
+                                         row[col_nr] != old[col_nr]):
+                cell_style, text = row[col_nr]
+                if cell_style != style:
+                    out.append(cell_style)
+                    style = cell_style
+                out.append(text)
+                col_nr += 1
+    if out:
+        out.append(ARST)
+    return "".join(out)
+
+
+class Explorer:
+    """ Hue (columns) × lightness (rows) grid of colour swatches """
+
+    def __init__(self, cols: int, rows: int) -> None:
+        self.saturation = 1.0
+        self.row = self.col = 0
+        self.resize(cols, rows)
+        self.row = self.rows // 2
+        self._grid = (None, [])  # !INF: (saturation, size) → cells cache
+
+    def resize(self, cols: int, rows: int) -> None:
+        self.cols = max(cols // len(CELL), 1)
+        self.rows = max(rows - 1, 1)  # !INF: the last line is the status
+        self.row = min(self.row, self.rows - 1)
+        self.col = min(self.col, self.cols - 1)
+
+    def rgb(self, row: int, col: int) -> tuple[int, int, int]:
+        hue = col / self.cols
+        lightness = 1 - (row + 1) / (self.rows + 1)
+        return tuple(round(channel * 255) for channel in
+                     hls_to_rgb(hue, lightness, self.saturation))
+
+    @property
+    def color(self) -> str:
+        return "#{:02x}{:02x}{:02x}".format(*self.rgb(self.row, self.col))
+
+    def grid(self) -> list[list]:
+        """ Cells of the grid (without the cursor), computed once per
+            saturation and size """
+
+        key = (self.saturation, self.cols, self.rows)
+        if self._grid[0] != key:
+            self._grid = (key, [[(cell_sgr(self.rgb(row, col)), CELL)
+                                 for col in range(self.cols)]
+                                for row in range(self.rows)])
+        return self._grid[1]
+
+    def frame(self) -> list[list]:
+        result = list(self.grid())
+        bg = self.rgb(self.row, self.col)
+        fg = (0, 0, 0) if sum(bg) > 384 else (255, 255, 255)
+        result[self.row] = list(result[self.row])
+        result[self.row][self.col] = (cell_sgr(bg, fg), CURSOR)
+        return result
+
+    def status(self) -> str:
+        r, g, b = self.rgb(self.row, self.col)
+        return (f"{self.color} {str((r, g, b)):<15} "
+                f"sat: {self.saturation:.0%} │ {EXPLORER_HELP}")
+
+    def handle(self, key: str) -> None:
+        if key in MOVES:
+            drow, dcol = MOVES[key]
+            self.row = min(max(self.row + drow, 0), self.rows - 1)
+            self.col = (self.col + dcol) % self.cols  # !INF: hue wraps
+        elif key == "more":
+            self.saturation = min(self.saturation + SATURATION_STEP, 1.0)
+        elif key == "less":
+            self.saturation = max(self.saturation - SATURATION_STEP, 0.0)
+
+
+def split_keys(data: bytes) -> tuple[list[str], bytes]:
+    """ Keys read from the terminal, and an unfinished escape sequence
+
+        `data` may hold several keys (e.g. a held arrow key) and may end in
+        the middle of an escape sequence; that part is returned, to be
+        completed by the next read.
+    """
+
+    keys = []
+    i = 0
+    while i < len(data):
+        rest = data[i:i + LONGEST_KEY]
+        if len(data) - i < LONGEST_KEY and any(
+                key.startswith(rest) and key != rest for key in KEYS):
+            return keys, data[i:]
+        size = next((size for size in range(len(rest), 0, -1)
+                     if rest[:size] in KEYS), 0)
+        if rest.startswith(b"\x1b[") and size < 3:
+            i += 2  # !INF: skip an unknown CSI key (e.g. ctrl + arrow)
+            while i < len(data) and not 0x40 <= data[i] <= 0x7e:
+                i += 1
+            i += 1
+        elif size:
+            keys.append(KEYS[rest[:size]])
+            i += size
+        else:
+            i += 1
+    return keys, b""
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """ os.write, until the whole data is written """
+
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def explore() -> str | None:
+    """ Pick a colour with the arrow keys; returns its #hex (or None) """
+
+    if termios is None or not sys.stdin.isatty():
+        raise OSError("the explorer needs a (POSIX) terminal")
+    fd_in, fd_out = sys.stdin.fileno(), sys.stdout.fileno()
+    size = get_terminal_size()
+    explorer = Explorer(size.columns, size.lines)
+    attrs = termios.tcgetattr(fd_in)
+    previous = None
+    picked = None
+    sys.stdout.flush()
+    write_all(fd_out, ALTSCR_ON.encode())
+    try:
+        tty.setraw(fd_in)
+        pending = b""
+        dirty = True
+        while True:
+            if dirty:
+                frame = explorer.frame()
+                # !INF: the whole redraw goes out in one write
+                write_all(fd_out, (
+                    render_changes(previous, frame)
+                    + f"\x1b[{explorer.rows + 1};1H\x1b[2K"
+                    + explorer.status()[:size.columns]).encode())
+                previous = frame
+                dirty = False
+            ready, _, _ = select([fd_in], [], [],
+                                 ESC_TIMEOUT if pending else RESIZE_POLL)
+            if ready:
+                keys, pending = split_keys(pending + os.read(fd_in, 1024))
+            elif pending:  # !INF: e.g. a lone Esc -- nothing more came
+                keys, pending = [KEYS.get(pending)], b""
+            else:
+                keys = []
+            done = False
+            for key in keys:
+                if key in ("quit", "pick"):
+                    picked = explorer.color if key == "pick" else None
+                    done = True
+                    break
+                if key is not None:
+                    explorer.handle(key)
+                    dirty = True
+            if done:
+                break
+            if get_terminal_size() != size:
+                size = get_terminal_size()
+                explorer.resize(size.columns, size.lines)
+                previous = None
+                dirty = True
+                write_all(fd_out, b"\x1b[2J")
+    finally:
+        termios.tcsetattr(fd_in, termios.TCSADRAIN, attrs)
+        write_all(fd_out, ALTSCR_OFF.encode())
+    return picked
@@ -0,0 +1,249 @@
+# ./src/termcolors/lib/pager.py
+
+"""
+Module for a paged (virtualised) view of big colour files
+"""
+
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from shutil import get_terminal_size
+from typing import Callable, Dict, Optional
+
+from .colorspec import is_comment
+from .compression import open_colors_file
+from .m_utils.printing import ARST, num_to_bg_ansi, term_del_line
+from .softdev.user_input import get_input
+
+FTITLE = __file__.split("/", maxsplit=-1)[-1].split(".", maxsplit=-1)[0]
+
+PREFETCH = 16  # !INF: rows parsed ahead of/behind the visible window
+INDEX_CHUNK = 4096  # !INF: rows indexed per extension of the offset index
+BLOCK_SIZE = 1 << 16  # !INF: bytes read from the file at once
+CACHED_BLOCKS = 64  # !INF: blocks kept (4 MB of the decompressed file)
+PAGER_HELP = ("n/enter: next, p: prev, g<nr>: row, G: end, /<text>: find, "
+              "q: quit")
+
+
+class LineIndex:
+    """ Lazily built offset index of the colour lines of a file
+
+        Only non-empty, non-comment lines are indexed. The index is extended
+        in one forward pass, as far as it is needed, so opening a big file
+        does not require reading it whole.
+
+        The file is read in BLOCK_SIZE blocks, the last CACHED_BLOCKS of
+        which (read while indexing or paging) are kept. This matters for
+        compressed files, where seeking backwards restarts decompression
+        from the start of the file: paging around the part of the file
+        seen last is served from the cache, only a jump further back pays
+        for decompressing the file up to that point.
+    """
+
+    def __init__(self, fin, cached_blocks: int = CACHED_BLOCKS) -> None:
+        self.fin = fin
+        self.offsets = array("q")
+        self.complete = False
+        self.cached_blocks = cached_blocks
+        self.blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._block_nr = 0  # !INF: next block of the forward pass
+        self._carry = b""  # !INF: unfinished line at the end of the pass
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def block(self, nr: int) -> bytes:
+        """ Block `nr` of the (decompressed) file, through the cache """
+
+        if nr in self.blocks:
+            self.blocks.move_to_end(nr)
+            return self.blocks[nr]
+        if self.fin.tell() != nr * BLOCK_SIZE:
+            self.fin.seek(nr * BLOCK_SIZE)
+        data = self.fin.read(BLOCK_SIZE)
+        self.blocks[nr] = data
+        if len(self.blocks) > self.cached_blocks:
+            self.blocks.popitem(last=False)
+        return data
+
+    def _index_line(self, line: bytes, pos: int) -> None:
+        stripped = line.strip()
+        if stripped and not (stripped.startswith(b"#") and
+                             is_comment(stripped.decode("utf-8", "replace"))):
+            self.offsets.append(pos)
+
+    def ensure(self, rows: int) -> int:
+        """ Extend the index to at least `rows` rows (or EOF) """
+
+        while not self.complete and len(self.offsets) < rows:
+            block = self.block(self._block_nr)
+            pos = self._block_nr * BLOCK_SIZE - len(self._carry)
+            self._block_nr += 1
+            data = self._carry + block
+            start = 0
+            end = data.find(b"\n")
+            while end != -1:
+                self._index_line(data[start:end], pos + start)
+                start = end + 1
+                end = data.find(b"\n", start)
+            self._carry = data[start:]
+            if len(block) < BLOCK_SIZE:  # !INF: EOF
+                if self._carry:  # !INF: the last line, without a newline
+                    self._index_line(self._carry, pos + start)
+                self._carry = b""
+                self.complete = True
+        return len(self.offsets)
+
+    def ensure_all(self) -> int:
+        """ Index the whole file """
+
+        while not self.complete:
+            self.ensure(len(self.offsets) + INDEX_CHUNK)
+        return len(self.offsets)
+
+    def read(self, row: int) -> str:
+        """ Read the raw (stripped) text of the indexed row """
+
+        offset = self.offsets[row]
+        nr, start = divmod(offset, BLOCK_SIZE)
+        parts = []
+        while True:
+            data = self.block(nr)
+            end = data.find(b"\n", start)
+            if end != -1 or len(data) < BLOCK_SIZE:
+                parts.append(data[start:end if end != -1 else None])
+                break
+            parts.append(data[start:])
+            nr, start = nr + 1, 0
+        return b"".join(parts).strip().decode("utf-8", errors="replace")
+
+
+def format_row(row: int, line: str, color: Optional[Dict],
+               width: int = 80, nr_chars: int = 8) -> str:
+    """ Render a single pager row (colour bar + description), cut to
+        `width` visible columns so that it never wraps """
+
+    head = f"{row + 1:>8} "[:width]
+    width -= len(head)
+    if color is None:
+        return head + f"{'?' * nr_chars}  ← invalid line: {line}"[:width]
+    nr_chars = min(nr_chars, width)
+    text = f" ← {color['x']} = {(color['r'], color['g'], color['b'])}"
+    return (f"{head}{num_to_bg_ansi(color['x'])}{' ' * nr_chars}{ARST}"
+            f"{text[:width - nr_chars]}")
+
+
+class ColorPager:
+    """ Paged view of a colour file
+
+        Only the rows on the screen, plus PREFETCH rows around them, are
+        parsed and encoded; everything else stays on disk and is reached
+        through the offset index.
+    """
+
+    def __init__(self, fin, parse_line: Callable[[str], Optional[Dict]],
+                 height: int | None = None, width: int | None = None,
+                 prefetch: int = PREFETCH) -> None:
+        self.index = LineIndex(fin)
+        self.parse_line = parse_line
+        size = get_terminal_size()
+        # !INF: rows + status + prompt; no line is wider than the terminal,
+        #       so every one of them takes exactly one screen line
+        self.height = height or max(size.lines - 3, 1)
+        self.width = width or size.columns
+        self.prefetch = prefetch
+        self.top = 0
+        self.cache: Dict[int, str] = {}
+
+    def _parse(self, line: str) -> Optional[Dict]:
+        try:
+            return self.parse_line(line)
+        except ValueError:
+            return None
+
+    def row(self, row: int) -> str:
+        if row not in self.cache:
+            line = self.index.read(row)
+            self.cache[row] = format_row(row, line, self._parse(line),
+                                         self.width)
+        return self.cache[row]
+
+    def window(self) -> list[str]:
+        """ Rendered rows of the current screen; refreshes the cache """
+
+        first = max(self.top - self.prefetch, 0)
+        end = self.top + self.height + self.prefetch
+        last = min(self.index.ensure(end), end)
+        self.cache = {k: v for k, v in self.cache.items() if first <= k < last}
+        for row in range(first, last):
+            self.row(row)
+        return [self.cache[row]
+                for row in range(self.top, min(self.top + self.height, last))]
+
+    def scroll(self, rows: int) -> None:
+        self.goto(self.top + rows)
+
+    def goto(self, row: int) -> None:
+        row = max(row, 0)
+        if self.index.ensure(row + 1) <= row:
+            row = max(len(self.index) - 1, 0)
+        self.top = row
+
+    def end(self) -> None:
+        self.index.ensure_all()
+        self.top = max(len(self.index) - self.height, 0)
+
+    def search(self, text: str) -> bool:
+        """ Move to the next row (after the top one) containing `text` """
+
+        text = text.lower()
+        row = self.top + 1
+        while self.index.ensure(row + 1) > row:
+            line = self.index.read(row)
+            color = self._parse(line)
+            if text in line.lower() or (color and text in color["x"]):
+                self.top = row
+                return True
+            row += 1
+        return False
+
+    def status(self) -> str:
+        total = len(self.index) if self.index.complete else\
+                f"{len(self.index)}+"
+        last = min(self.top + self.height, len(self.index))
+        return f"rows {self.top + 1}-{last} of {total}"
+
+
+def page_colors(filepath: str | Path,
+                parse_line: Callable[[str], Optional[Dict]]) -> None:
+    """ Browse a colour file page by page """
+
+    with open_colors_file(filepath, "rb") as fin:
+        pager = ColorPager(fin, parse_line)
+        message = ""
+        while True:
+            lines = pager.window()
+            print(*lines, sep="\n")
+            print(f"{pager.status()} {message}".rstrip()[:pager.width])
+            ans = get_input(PAGER_HELP[:max(pager.width - 4, 0)])
+            if ans is None:  # !INF: KeyboardInterrupt
+                break
+            term_del_line(len(lines) + 2)
+            message = ""
+            ans = ans.strip()
+            if ans in ("", "n"):
+                pager.scroll(pager.height)
+            elif ans == "p":
+                pager.scroll(-pager.height)
+            elif ans == "G":
+                pager.end()
+            elif ans.startswith("g"):
+                try:
+                    pager.goto(int(ans[1:]) - 1)
+                except ValueError:
+                    message = f"(invalid row: {ans[1:].strip()!r})"
+            elif ans.startswith("/"):
+                if not pager.search(ans[1:]):
+                    message = f"({ans[1:]!r} not found)"
+            elif ans in ("q", "quit"):
+                break
@@ -48,8 +48,10 @@ def get_input(prompt: str = "Input", mark: str = ">",
     while condition:
         try:
             # cprintd(f"asking for input…", location=location)
-            cprint(f"{prompt}{nl}", end=nl)
-            ans = input()
+            # !INF: the prompt goes through input(), so that readline (when
+            #       imported) knows it and redraws it, e.g. after listing
+            #       the completions
+            ans = input(f"{prompt}{nl}{nl}")
             if ans == "" and default is not None:
                 return default
 
@@ -0,0 +1,171 @@
+# ./src/termcolors/lib/stats.py
+
+"""
+Module for colour statistics over (big) streams of colours
+"""
+
+import re
+from array import array
+from colorsys import hls_to_rgb
+from heapq import nlargest
+from typing import Iterable, Iterator
+
+from .m_utils.printing import ARST, num_to_bg_ansi
+
+FTITLE = __file__.split("/", maxsplit=-1)[-1].split(".", maxsplit=-1)[0]
+
+NR_COLORS = 1 << 24
+HUES = ("red", "orange", "yellow", "chartreuse", "green", "spring",
+        "cyan", "azure", "blue", "violet", "magenta", "rose")
+GREY = "grey"
+GREY_SATURATION = 0.1  # !INF: colours less saturated than that are grey
+LIGHTNESS_BINS = 5
+DENSE_AFTER = 1 << 18  # !INF: distinct colours before the counter goes dense
+NONZERO_RE = re.compile(rb"[^\x00]")
+BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1)
+             for byte in range(256))  # !INF: set bits of every byte value
+
+
+class ColorCounter:
+    """ Occurrence counter of 24-bit colours (as ints)
+
+        Starts as a dict; once it holds DENSE_AFTER distinct colours it
+        switches to a flat array of 2^24 32-bit counters (64 MB), so the
+        memory it uses never grows past that. Counts saturate at 2^32 - 1.
+
+        Args:
+            bitmap (bytearray): bitmap of the colours seen (see ColorStats),
+                used to walk only the non-zero counters of the dense array
+    """
+
+    def __init__(self, bitmap: bytearray) -> None:
+        self.bitmap = bitmap
+        self.sparse: dict[int, int] | None = {}
+        self.dense: array | None = None
+
+    def add(self, value: int) -> None:
+        if self.dense is not None:
+            try:
+                self.dense[value] += 1
+            except OverflowError:
+                pass  # !INF: saturated
+            return
+        self.sparse[value] = self.sparse.get(value, 0) + 1
+        if len(self.sparse) >= DENSE_AFTER:
+            self.dense = array("I", [0]) * NR_COLORS
+            for key, count in self.sparse.items():
+                self.dense[key] = count
+            self.sparse = None
+
+    def values(self) -> Iterator[int]:
+        """ Colours seen, from the set bits of the bitmap """
+
+        bitmap = self.bitmap
+        for match in NONZERO_RE.finditer(bitmap):
+            byte = match.start()
+            base = byte << 3
+            for bit in BITS[bitmap[byte]]:
+                yield base | bit
+
+    def items(self) -> Iterator[tuple[int, int]]:
+        if self.dense is None:
+            return iter(self.sparse.items())
+        dense = self.dense
+        return ((value, dense[value]) for value in self.values())
+
+    def most_common(self, k: int) -> list[tuple[int, int]]:
+        """ k most common colours, using a heap bounded to k items """
+
+        if self.dense is None:
+            return nlargest(k, self.sparse.items(), key=lambda item: item[1])
+        dense = self.dense
+        return [(value, dense[value])
+                for value in nlargest(k, self.values(), key=dense.__getitem__)]
+
+
+class ColorStats:
+    """ One-pass statistics of a stream of 24-bit colours
+
+        Exact uniqueness is tracked in a 2^24-bit (2 MB) bitmap.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.unique = 0
+        self.bitmap = bytearray(NR_COLORS >> 3)
+        self.counter = ColorCounter(self.bitmap)
+
+    def add(self, value: int) -> None:
+        self.total += 1
+        byte, bit = value >> 3, 1 << (value & 7)
+        if not self.bitmap[byte] & bit:
+            self.bitmap[byte] |= bit
+            self.unique += 1
+        self.counter.add(value)
+
+    def update(self, values: Iterable[int]) -> "ColorStats":
+        for value in values:
+            self.add(value)
+        return self
+
+    def histogram(self) -> dict[str, list[int]]:
+        """ Hue × lightness histogram (plus a row for greys) """
+
+        result = {hue: [0] * LIGHTNESS_BINS for hue in (*HUES, GREY)}
+        rows = [result[hue] for hue in HUES]
+        grey = result[GREY]
+        nr_hues = len(HUES)
+        # !INF: HLS as in colorsys.rgb_to_hls, inlined -- this runs once per
+        #       unique colour
+        for value, count in self.counter.items():
+            r, g, b = value >> 16, value >> 8 & 0xff, value & 0xff
+            high, low = max(r, g, b), min(r, g, b)
+            chroma, total = high - low, high + low
+            lightness = min(total * LIGHTNESS_BINS // 510, LIGHTNESS_BINS - 1)
+            if not chroma or chroma < GREY_SATURATION * (
+                    total if total <= 255 else 510 - total):
+                grey[lightness] += count
+                continue
+            if r == high:
+                hue = (g - b) / chroma
+            elif g == high:
+                hue = 2 + (b - r) / chroma
+            else:
+                hue = 4 + (r - g) / chroma
+            rows[int(hue % 6 * nr_hues / 6 + 0.5) % nr_hues][lightness] +=\
+                count
+        return result
+
+
+def _swatch(value: int, nr_chars: int = 4) -> str:
+    return f"{num_to_bg_ansi(f'{value:06x}')}{' ' * nr_chars}{ARST}"
+
+
+def format_stats(stats: ColorStats, top: int = 10) -> list[str]:
+    """ Report lines of the statistics """
+
+    total = stats.total or 1
+    lines = [f"colours: {stats.total} (unique: {stats.unique})"]
+    if top and stats.total:
+        lines.append(f"top {top}:")
+        for nr, (value, count) in enumerate(stats.counter.most_common(top),
+                                            start=1):
+            rgb = (value >> 16, value >> 8 & 0xff, value & 0xff)
+            lines.append(f"{nr:>4}. {_swatch(value)} #{value:06x} = "
+                         f"{str(rgb):<15} × {count} "
+                         f"({count / total:.1%})")
+    if stats.total:
+        step = 100 // LIGHTNESS_BINS
+        header = "".join(f"{f'{i * step}-{(i + 1) * step}%':>10}"
+                         for i in range(LIGHTNESS_BINS))
+        lines.append(f"{'hue × lightness':<17}{header}")
+        for i, (hue, counts) in enumerate(stats.histogram().items()):
+            if hue == GREY:
+                value = 0x808080
+            else:
+                r, g, b = hls_to_rgb(i / len(HUES), 0.5, 1)
+                value = round(r * 255) << 16 | round(g * 255) << 8 |\
+                    round(b * 255)
+            lines.append(f"{_swatch(value, 2)} {hue:<14}"
+                         + "".join(f"{count:>10}" for count in counts))
+    return lines
@@ -0,0 +1,68 @@
+import pytest
+
+from termcolors.cli import detect_format, parse_color_line
+from termcolors.lib.colornames import COLOR_NAMES, complete_name
+from termcolors.lib.colorspec import is_comment, parse_color_spec
+from termcolors.lib.softdev.debug import RangeError
+
+
+@pytest.mark.parametrize(
+    "spec, rgb",
+    [
+        ("#ff8000", (255, 128, 0)),
+        ("#F80", (255, 136, 0)),
+        ("rgb(255, 128, 0)", (255, 128, 0)),
+        ("rgb(100% 50% 0%)", (255, 128, 0)),
+        ("rgba(1, 2, 3, 0.5)", (1, 2, 3)),
+        ("hsl(120, 100%, 50%)", (0, 255, 0)),
+        ("HSL(0deg 0% 100%)", (255, 255, 255)),
+        ("rebeccapurple", (102, 51, 153)),
+        ("Alice Blue", (240, 248, 255)),
+        ("gray", (128, 128, 128)),
+        ("x11gray", (190, 190, 190)),
+    ],
+)
+def test_parse_color_spec(spec, rgb):
+    assert parse_color_spec(spec) == rgb
+
+
+@pytest.mark.parametrize("spec", ["#ff80", "rgb(1, 2)", "blurple", ""])
+def test_invalid_color_spec(spec):
+    with pytest.raises(ValueError):
+        parse_color_spec(spec)
+
+
+def test_out_of_range_color_spec():
+    with pytest.raises(RangeError):
+        parse_color_spec("rgb(256, 0, 0)")
+
+
+def test_names_are_frozen():
+    with pytest.raises(TypeError):
+        COLOR_NAMES["mycolour"] = 0
+
+
+def test_complete_name():
+    assert complete_name("Tan") == ["tan", "tan1", "tan2", "tan3", "tan4"]
+    assert complete_name("dark", limit=2) == ["darkblue", "darkcyan"]
+    assert complete_name("zzz") == []
+    assert len(complete_name("")) == len(COLOR_NAMES)
+
+
+def test_hex_line_is_not_a_comment():
+    assert not is_comment("#00ff00")
+    assert is_comment("# palette: nord")
+    assert is_comment("#ff0000 red")
+
+
+def test_detect_format():
+    lines = ["# palette: x", "#ff0000", "red", "blue", "1;2;3;decm"]
+    assert detect_format(lines) == "name"
+
+
+def test_parse_color_line_falls_back():
+    assert parse_color_line("red", fmt="ssv")["x"] == "#ff0000"
+    assert parse_color_line("1;2;3;decm", fmt="name")["x"] == "#010203"
+    assert parse_color_line("rgb(300, 0, 0)", fmt="rgb") is None
+    with pytest.raises(ValueError):
+        parse_color_line("not a colour", fmt="name")
@@ -0,0 +1,32 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from termcolors import cli
+from termcolors.lib.compression import compression, open_colors_file
+
+CONTENT = "# palette: packed; filename: packed.ssv\n255;0;0;decm\n#00ff00\n"
+
+
+@pytest.mark.parametrize(
+    "suffix, module, kind",
+    [(".gz", gzip, "gz"), (".bz2", bz2, "bz2"), (".xz", lzma, "xz")],
+)
+def test_compressed_file(tmp_path, suffix, module, kind):
+    path = tmp_path / f"packed.ssv{suffix}"
+    path.write_bytes(module.compress(CONTENT.encode()))
+    assert compression(path) == kind
+    with open_colors_file(path) as fin:
+        assert fin.read() == CONTENT
+    colors = cli.read_colors_file(str(path))
+    assert [color["x"] for color in colors] == ["#ff0000", "#00ff00"]
+
+
+def test_plain_file(tmp_path):
+    path = tmp_path / "plain.ssv"
+    path.write_text(CONTENT)
+    assert compression(path) is None
+    with open_colors_file(path, "rb") as fin:
+        assert fin.read() == CONTENT.encode()
@@ -0,0 +1,44 @@
+from termcolors.lib.explorer import (CURSOR, Explorer, render_changes,
+                                     split_keys)
+
+
+def test_full_draw_shares_sgr_in_runs():
+    red, blue = "\x1b[48;2;255;0;0m", "\x1b[48;2;0;0;255m"
+    frame = [[(red, "  "), (red, "  "), (blue, "  ")]]
+    assert render_changes(None, frame) ==\
+        f"\x1b[1;1H{red}    {blue}  \x1b[0m"
+
+
+def test_only_changed_cells_are_redrawn():
+    explorer = Explorer(cols=40, rows=11)
+    assert (explorer.cols, explorer.rows) == (20, 10)
+    previous = explorer.frame()
+    assert render_changes(previous, previous) == ""
+
+    explorer.handle("right")
+    out = render_changes(previous, explorer.frame())
+    assert out.count("\x1b[6;1H") == 1  # !INF: one run: old + new cursor
+    assert out.count(CURSOR) == 1
+    assert out.count("\x1b[48;2;") == 2
+
+
+def test_moves_and_saturation():
+    explorer = Explorer(cols=40, rows=11)
+    explorer.handle("left")
+    assert explorer.col == explorer.cols - 1
+    for _ in range(20):
+        explorer.handle("up")
+    assert explorer.row == 0
+    for _ in range(11):
+        explorer.handle("less")
+    assert explorer.saturation == 0
+    r, g, b = explorer.rgb(explorer.row, explorer.col)
+    assert r == g == b
+
+
+def test_split_keys():
+    assert split_keys(b"\x1b[C\x1b[Cj") == (["right", "right", "down"], b"")
+    assert split_keys(b"\x1b[C\x1b[") == (["right"], b"\x1b[")
+    assert split_keys(b"\x1b") == ([], b"\x1b")
+    assert split_keys(b"\x1b[1;5Cq") == (["quit"], b"")
+    assert split_keys(b"\x1bOAx") == (["up"], b"")
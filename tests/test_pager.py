@@ -0,0 +1,105 @@
+import gzip
+import io
+import re
+
+from termcolors.cli import parse_color_line
+from termcolors.lib.compression import open_colors_file
+from termcolors.lib.pager import ColorPager, LineIndex
+
+
+def make_file(rows: int) -> io.BytesIO:
+    lines = ["# palette: test; filename: test.ssv"]
+    for i in range(rows):
+        lines.append(f"{i % 256};0;0;decm")
+        if i % 10 == 0:
+            lines.append("# comment")
+    return io.BytesIO(("\n".join(lines) + "\n").encode())
+
+
+def test_index_is_built_lazily():
+    index = LineIndex(make_file(10_000))
+    assert 50 <= index.ensure(50) < 10_000
+    assert not index.complete
+    assert index.read(49) == "49;0;0;decm"
+    assert index.ensure_all() == 10_000
+    assert index.read(9_999) == f"{9_999 % 256};0;0;decm"
+
+
+def test_only_window_is_parsed():
+    parsed = []
+
+    def parse(line):
+        parsed.append(line)
+        return parse_color_line(line)
+
+    pager = ColorPager(make_file(100_000), parse, height=10, prefetch=5)
+    lines = pager.window()
+    assert len(lines) == 10
+    assert "← #000000" in lines[0]
+    assert len(parsed) == 15
+    assert len(pager.index) < 100_000
+
+    pager.goto(500)
+    pager.window()
+    assert set(pager.cache) == set(range(495, 515))
+
+
+def test_search_and_end():
+    pager = ColorPager(make_file(1_000), parse_color_line, height=10)
+    assert pager.search("#ff0000")
+    assert pager.top == 255
+    assert not pager.search("#00ff00")
+    pager.end()
+    assert pager.top == 990
+    assert pager.status() == "rows 991-1000 of 1000"
+
+
+def test_jump_back_after_end_parses_only_window():
+    parsed = []
+
+    def parse(line):
+        parsed.append(line)
+        return parse_color_line(line)
+
+    pager = ColorPager(make_file(100_000), parse, height=10, prefetch=5)
+    pager.end()
+    pager.window()
+    assert set(pager.cache) == set(range(99_985, 100_000))
+    parsed.clear()
+
+    pager.goto(0)
+    lines = pager.window()
+    assert len(lines) == 10
+    assert len(parsed) == 15
+    assert set(pager.cache) == set(range(0, 15))
+
+
+def test_compressed_file_pages_back_from_cache(tmp_path, monkeypatch):
+    path = tmp_path / "big.ssv.gz"
+    path.write_bytes(gzip.compress(make_file(50_000).getvalue()))
+    with open_colors_file(path, "rb") as fin:
+        pager = ColorPager(fin, parse_color_line, height=10)
+        pager.end()
+        assert pager.window()[-1].startswith("   50000 ")
+
+        def no_seek(*args):
+            raise AssertionError("seek on the compressed stream")
+
+        monkeypatch.setattr(fin, "seek", no_seek)
+        for _ in range(100):
+            pager.scroll(-pager.height)
+            pager.window()
+        assert pager.top == 48_990
+        assert pager.index.read(48_990) == f"{48_990 % 256};0;0;decm"
+
+
+def test_rows_fit_the_terminal_width():
+    ansi_re = re.compile(r"\x1b\[[0-9;]*m")
+    fin = io.BytesIO(b"255;128;0;decm\nnot a colour " + b"x" * 100 + b"\n")
+    for width in (80, 40, 12):
+        pager = ColorPager(fin, parse_color_line, height=10, width=width)
+        lines = pager.window()
+        assert len(lines) == 2
+        assert "← #ff8000" in lines[0] or width < 30
+        for line in lines:
+            assert len(ansi_re.sub("", line)) <= width
@@ -0,0 +1,29 @@
+from termcolors import cli
+from termcolors.lib.stats import ColorStats, format_stats
+
+
+def test_counts_and_top():
+    stats = ColorStats().update([0xff0000, 0x00ff00, 0xff0000, 0xffffff,
+                                 0xff0000, 0x00ff00, 0x000000])
+    assert stats.total == 7
+    assert stats.unique == 4
+    assert stats.counter.most_common(2) == [(0xff0000, 3), (0x00ff00, 2)]
+
+
+def test_histogram():
+    stats = ColorStats().update([0xff0000, 0x800000, 0x0000ff, 0x808080])
+    histogram = stats.histogram()
+    assert histogram["red"] == [0, 1, 1, 0, 0]
+    assert histogram["blue"] == [0, 0, 1, 0, 0]
+    assert histogram["grey"] == [0, 0, 1, 0, 0]
+    assert sum(map(sum, histogram.values())) == 4
+
+
+def test_stats_command(tmp_path, capsys):
+    path = tmp_path / "colors.ssv"
+    path.write_text("255;0;0;decm\n#ff0000\nred\nblue\n")
+    cli.color_stats([str(path), str(path)], top=1)
+    out = capsys.readouterr().out
+    assert "colours: 8 (unique: 2)" in out
+    assert "#ff0000 = (255, 0, 0)     × 6 (75.0%)" in out
+    assert format_stats(ColorStats()) == ["colours: 0 (unique: 0)"]
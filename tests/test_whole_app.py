@@ -17,7 +17,7 @@ def test_integration(monkeypatch, capsys):
     # for _ in range(10):
     r, g, b = sample(range(0, 256), 3)
     inputs = iter([f"{r};{g};{b}", "fg", "quit"])
-    monkeypatch.setattr("builtins.input", lambda: next(inputs))
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
 
     cli.main()
 
@@ -44,7 +44,7 @@ def test_integration_full(monkeypatch, capsys):
 
     # kolejność wejścia: kolor -> fg -> quit
     inputs = iter([f"{r};{g};{b}", "fg", "quit"])
-    monkeypatch.setattr("builtins.input", lambda: next(inputs))
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
 
     # schowek (symulacja pyperclip)
     monkeypatch.setattr(cli.pyperclip, "copy",
@@ -63,3 +63,34 @@ def test_integration_full(monkeypatch, capsys):
 
     # sprawdzenie, że "fg" skopiowało poprawny kod do schowka
     assert clipboard_content["last"] == f"\033[38;2;{r};{g};{b}m"
+
+
+def test_batch_conversion_of_given_file(capsys):
+    cli.batch_conversion("assets/simple.ssv")
+    captured = capsys.readouterr()
+    assert "48;2;0;0;255m" in captured.out
+
+
+def test_pager_requires_file(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["termcolors", "-p"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+
+def test_prompt_is_given_to_input(monkeypatch):
+    prompts = []
+    monkeypatch.setattr("builtins.input",
+                        lambda prompt="": prompts.append(prompt) or "quit")
+    assert cli.get_input("Enter a colour") == "quit"
+    assert prompts == ["Enter a colour > "]
+
+
+@pytest.mark.skipif(cli.readline is None, reason="no readline")
+def test_listed_completions_are_deleted(monkeypatch, capsys):
+    monkeypatch.setitem(cli.STATE, 'lines_to_del', 1)
+    monkeypatch.setitem(cli.STATE, 'prompt', "Enter a colour > ")
+    cli.display_matches("darkg", list(cli.completions("darkg")), 14)
+    out = capsys.readouterr().out
+    assert "'darkgreen'" in out
+    assert out.endswith("\nEnter a colour > ")
+    assert cli.STATE['lines_to_del'] == out.count("\n") + 1